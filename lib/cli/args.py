@@ -11,7 +11,7 @@ import textwrap
 import typing as T
 
 from lib.utils import get_backend
-from lib.gpu_stats import GPUStats
+from lib.gpu_stats import get_gpu_stats
 
 from plugins.plugin_loader import PluginLoader
 
@@ -20,7 +20,7 @@ from .actions import (DirFullPaths, DirOrFileFullPaths, DirOrFilesFullPaths, Fil
 from .launcher import ScriptExecutor
 
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
-_GPUS = GPUStats().cli_devices
+_GPUS = get_gpu_stats().cli_devices
 
 # LOCALES
 _LANG = gettext.translation("lib.cli.args", localedir="locales", fallback=True)
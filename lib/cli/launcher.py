@@ -9,7 +9,7 @@ import typing as T
 
 from importlib import import_module
 
-from lib.gpu_stats import set_exclude_devices, GPUStats
+from lib.gpu_stats import get_gpu_stats, set_exclude_devices
 from lib.logger import crash_log, log_setup
 from lib.utils import (FaceswapError, get_backend, get_tf_version,
                        safe_shutdown, set_backend, set_system_verbosity)
@@ -268,7 +268,7 @@ class ScriptExecutor():  # pylint:disable=too-few-public-methods
             arguments.exclude_gpus = [int(idx) for idx in arguments.exclude_gpus]
             set_exclude_devices(arguments.exclude_gpus)
 
-        if GPUStats().exclude_all_devices:
+        if get_gpu_stats().exclude_all_devices:
             msg = "Switching backend to CPU"
             set_backend("cpu")
             logger.info(msg)
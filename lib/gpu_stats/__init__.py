@@ -22,3 +22,26 @@ elif backend == "rocm":
     from .rocm import ROCm as GPUStats  # type:ignore
 else:
     from .cpu import CPUStats as GPUStats  # type:ignore
+
+_INSTANCE: GPUStats | None = None
+
+
+def get_gpu_stats() -> GPUStats:
+    """ Obtain a cached :class:`GPUStats` instance.
+
+    Querying GPU statistics initializes and tears down the vendor library (eg: NVML) each time,
+    which involves driver round-trips. Device enumeration does not change within the lifetime of
+    the process, so callers which only require static hardware information (device count, names,
+    excluded devices) should use this cached instance. The VRAM figures held are a snapshot from
+    when the instance was first created, so callers requiring current VRAM availability should
+    instantiate :class:`GPUStats` directly.
+
+    Returns
+    -------
+    :class:`GPUStats`
+        The GPU statistics object for the active backend
+    """
+    global _INSTANCE  # pylint:disable=global-statement
+    if _INSTANCE is None:
+        _INSTANCE = GPUStats()
+    return _INSTANCE
@@ -733,6 +733,74 @@ class UpscaleDNYBlock():  # pylint:disable=too-few-public-methods
         return var_x
 
 
+class UpscaleResidualBlock():  # pylint:disable=too-few-public-methods
+    """ An upscale layer followed by a residual block.
+
+    Combines the :class:`UpscaleBlock` + :class:`ResidualBlock` pairing used by dfaker style
+    decoders into a single block, keeping the intermediate activation out of the plugin code and
+    letting the backend fuse the convolution epilogues.
+
+    Parameters
+    ----------
+    filters: int
+        The dimensionality of the output space (i.e. the number of output filters in the
+        convolution)
+    kernel_size: int, optional
+        An integer or tuple/list of 2 integers, specifying the height and width of the 2D
+        convolution window. Can be a single integer to specify the same value for all spatial
+        dimensions. Default: 3
+    padding: ["valid", "same"], optional
+        The padding to use. NB: If reflect padding has been selected in the user configuration
+        options, then the residual convolutions will use reflect padding. Default: `"same"`
+    scale_factor: int, optional
+        The amount to upscale the image. Default: `2`
+    kwargs: dict
+        Any additional Keras standard layer keyword arguments to pass to the residual
+        Convolutional 2D layers
+    """
+    def __init__(self,
+                 filters: int,
+                 kernel_size: int | tuple[int, int] = 3,
+                 padding: str = "same",
+                 scale_factor: int = 2,
+                 **kwargs) -> None:
+        self._name = _get_name(f"upscale_res_{filters}")
+        logger.debug("name: %s. filters: %s, kernel_size: %s, padding: %s, scale_factor: %s, "
+                     "kwargs: %s)",
+                     self._name, filters, kernel_size, padding, scale_factor, kwargs)
+
+        self._filters = filters
+        self._kernel_size = kernel_size
+        self._padding = padding
+        self._scale_factor = scale_factor
+        self._kwargs = kwargs
+
+    def __call__(self, inputs: Tensor) -> Tensor:
+        """ Call the Faceswap Upscale Residual Block.
+
+        Parameters
+        ----------
+        inputs: Tensor
+            The input to the layer
+
+        Returns
+        -------
+        Tensor
+            The output tensor from the Upscale Residual Block
+        """
+        var_x = UpscaleBlock(self._filters,
+                             kernel_size=self._kernel_size,
+                             padding=self._padding,
+                             scale_factor=self._scale_factor,
+                             activation=None)(inputs)
+        var_x = LeakyReLU(alpha=0.2, name=f"{self._name}_leakyrelu")(var_x)
+        var_x = ResidualBlock(self._filters,
+                              kernel_size=self._kernel_size,
+                              padding=self._padding,
+                              **self._kwargs)(var_x)
+        return var_x
+
+
 # << OTHER BLOCKS >>
 class ResidualBlock():  # pylint:disable=too-few-public-methods
     """ Residual block from dfaker.
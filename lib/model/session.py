@@ -19,6 +19,12 @@ if T.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)  # pylint:disable=invalid-name
 
+_MODEL_CACHE: dict[tuple[str, str], Model] = {}
+""" dict: Loaded :class:`keras.Model` objects keyed by model file path and the mixed precision
+policy that was active when the model was built. Re-instantiating a plugin within the same
+process (eg: serial extraction passes in low VRAM mode) reuses the already built model rather
+than re-parsing the weights file and rebuilding the graph. """
+
 
 class KSession():
     """ Handles the settings of backend sessions for inference models.
@@ -71,6 +77,7 @@ class KSession():
         self._model_path = model_path
         self._model_kwargs = {} if not model_kwargs else model_kwargs
         self._model: Model | None = None
+        self._model_from_cache = False
         logger.trace("Initialized: %s", self.__class__.__name__,)  # type:ignore
 
     def predict(self,
@@ -152,17 +159,57 @@ class KSession():
 
         For Tensorflow backends, the `make_predict_function` method is called on the model to make
         it thread safe.
+
+        If the model file has already been loaded within this process then the existing
+        :class:`keras.Model` is reused rather than re-parsed from disk.
         """
+        if self._load_cached_model():
+            return
         logger.verbose("Initializing plugin model: %s", self._name)  # type:ignore
         with self._context:
             self._model = k_load_model(self._model_path, compile=False, **self._model_kwargs)
             self._model.make_predict_function()
+        _MODEL_CACHE[self._cache_key()] = self._model
+
+    def _cache_key(self) -> tuple[str, str]:
+        """ Obtain the process level cache key for this model.
+
+        The key includes the active mixed precision policy as well as the model file path, as
+        the same file can be built under different policies (eg: S3FD with FP16 enabled and
+        disabled) and the resulting models are not interchangeable.
+
+        Returns
+        -------
+        tuple
+            The model file path and the name of the active mixed precision policy
+        """
+        return self._model_path, tf.keras.mixed_precision.global_policy().name
+
+    def _load_cached_model(self) -> bool:
+        """ Attempt to obtain the model from the process level cache.
+
+        Returns
+        -------
+        bool
+            ``True`` if the model existed in the cache and has been set, otherwise ``False``
+        """
+        model = _MODEL_CACHE.get(self._cache_key())
+        if model is None:
+            return False
+        logger.debug("Reusing cached model for: %s ('%s')", self._name, self._model_path)
+        self._model = model
+        self._model_from_cache = True
+        return True
 
     def define_model(self, function: Callable) -> None:
         """ Defines a model from the given function.
 
         This method acts as a wrapper for :class:`keras.models.Model()`.
 
+        If the model file has already been loaded within this process then the existing
+        :class:`keras.Model` is reused and the function is not executed. The subsequent call to
+        :func:`load_model_weights` will also be skipped.
+
         Parameters
         ----------
         function: function
@@ -170,6 +217,8 @@ class KSession():
             ``outputs``. The function that generates these results should be passed in, NOT the
             results themselves, as the function needs to be executed within the correct context.
         """
+        if self._load_cached_model():
+            return
         with self._context:
             self._model = Model(*function())
 
@@ -182,12 +231,19 @@ class KSession():
 
         For Tensorflow backends, the `make_predict_function` method is called on the model to make
         it thread safe.
+
+        If the model was obtained from the process level cache in :func:`define_model` then its
+        weights are already populated and the load is skipped.
         """
+        if self._model_from_cache:
+            logger.debug("Model reused from cache. Skipping weights load: %s", self._name)
+            return
         logger.verbose("Initializing plugin model: %s", self._name)  # type:ignore
         assert self._model is not None
         with self._context:
             self._model.load_weights(self._model_path)
             self._model.make_predict_function()
+        _MODEL_CACHE[self._cache_key()] = self._model
 
     def append_softmax_activation(self, layer_index: int = -1) -> None:
         """ Append a softmax activation layer to a model
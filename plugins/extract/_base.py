@@ -464,7 +464,9 @@ class Extractor():
             return
 
         logger.info("Initializing %s (%s)...", self.name, self._plugin_type.title())
-        self.queue_size = 1
+        # Double-buffer the internal queues so the predict thread always has a batch ready
+        # whilst the input thread is pre-processing the next one
+        self.queue_size = 2
         name = self.name.replace(" ", "_").lower()
         self._add_queues(kwargs["in_queue"],
                          kwargs["out_queue"],
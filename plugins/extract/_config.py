@@ -40,6 +40,18 @@ class Config(FaceswapConfig):
                    "This option prevents Tensorflow from allocating all of the GPU VRAM at launch "
                    "but can lead to higher VRAM fragmentation and slower performance. Should only "
                    "be enabled if you are having problems running extraction."))
+        self.add_item(
+            section=section,
+            title="reuse_duplicate_faces",
+            datatype=bool,
+            default=False,
+            group=_("settings"),
+            info=_("If enabled, the aligner will re-use the landmark predictions for any face "
+                   "which is near identical to a recently aligned face, skipping the aligner "
+                   "model for that face. Consecutive frames of a video are often near "
+                   "duplicates, so this can noticeably speed up extraction from video sources "
+                   "at the cost of a tiny amount of per-frame precision. This option is ignored "
+                   "if 're-feed' or 're-align' have been selected."))
         self.add_item(
             section=section,
             title="aligner_min_scale",
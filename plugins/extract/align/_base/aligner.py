@@ -16,6 +16,7 @@ from __future__ import annotations
 import logging
 import typing as T
 
+from collections import deque
 from dataclasses import dataclass, field
 from time import sleep
 
@@ -173,6 +174,12 @@ class Aligner(Extractor):  # pylint:disable=abstract-method
         self._needs_refeed_masks: bool = self._re_feed > 0 and (
             self.config["filter_refeed"] or (self._re_align.do_refeeds and
                                              self._re_align.do_filter))
+        # Re-using predictions is incompatible with re-feed/re-align as those paths feed
+        # deliberately perturbed crops through the model
+        self._reuse_duplicates: bool = (self.config["reuse_duplicate_faces"]
+                                        and re_feed == 0 and not re_align)
+        self._duplicate_cache: deque[tuple[np.ndarray, np.ndarray]] = deque(maxlen=64)
+        """ Recent (hash, prediction) pairs. Only accessed from the predict thread """
         self.set_normalize_method(normalize_method)
 
         logger.debug("Initialized %s", self.__class__.__name__)
@@ -511,6 +518,75 @@ class Aligner(Extractor):  # pylint:disable=abstract-method
         return batch
 
     # <<< PREDICT WRAPPER >>> #
+    @classmethod
+    def _hash_faces(cls, feed: np.ndarray) -> np.ndarray:
+        """ Obtain a 64 bit perceptual hash for each face in a batch of feed images.
+
+        Hashes are generated from the top-left 8x8 block of the DCT of the down-scaled
+        gray-scale face, thresholded at its median.
+
+        Parameters
+        ----------
+        feed: :class:`numpy.ndarray`
+            The batch of model-ready face images to be hashed
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            Boolean array of shape (`batchsize`, 64) containing the hash for each face
+        """
+        retval = np.empty((feed.shape[0], 64), dtype="bool")
+        for idx, face in enumerate(feed):
+            gray = face.mean(axis=-1) if face.ndim == 3 else face
+            gray = cv2.resize(gray.astype("float32"), (32, 32), interpolation=cv2.INTER_AREA)
+            dct = cv2.dct(gray)[:8, :8].flatten()
+            retval[idx] = dct > np.median(dct)
+        return retval
+
+    def _predict_with_cache(self, feed: np.ndarray) -> np.ndarray:
+        """ Run the aligner model, skipping any faces which are near duplicates of a recently
+        predicted face and re-using the cached prediction for them instead.
+
+        Predictions are crop-relative, so a cached prediction maps back to frame co-ordinates
+        through the current face's own center and scale.
+
+        Parameters
+        ----------
+        feed: :class:`numpy.ndarray`
+            The batch of faces to obtain predictions for
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The predictions for the batch, combined from cached and freshly predicted faces
+        """
+        hashes = self._hash_faces(feed)
+        cached: list[tuple[int, np.ndarray]] = []
+        misses: list[int] = []
+        for idx, face_hash in enumerate(hashes):
+            match = next((pred for stored, pred in self._duplicate_cache
+                          if np.count_nonzero(stored != face_hash) <= 4), None)
+            if match is None:
+                misses.append(idx)
+            else:
+                cached.append((idx, match))
+
+        new_preds = self.predict(feed[np.array(misses)]) if misses else np.array([])
+        if not cached:
+            retval = new_preds
+        else:
+            sample = new_preds[0] if misses else cached[0][1]
+            retval = np.empty((feed.shape[0], *sample.shape), dtype=sample.dtype)
+            for idx, pred in cached:
+                retval[idx] = pred
+        for idx, pred in zip(misses, new_preds):
+            self._duplicate_cache.append((hashes[idx], pred))
+            if cached:
+                retval[idx] = pred
+        logger.trace("Re-used %s cached prediction(s) for batch "  # type:ignore[attr-defined]
+                     "of %s", len(cached), feed.shape[0])
+        return retval
+
     def _predict(self, batch: BatchType) -> AlignerBatch:
         """ Just return the aligner's predict function
 
@@ -531,7 +607,10 @@ class Aligner(Extractor):  # pylint:disable=abstract-method
         """
         assert isinstance(batch, AlignerBatch)
         try:
-            preds = [self.predict(feed) for feed in batch.refeeds]
+            if self._reuse_duplicates and not batch.second_pass:
+                preds = [self._predict_with_cache(feed) for feed in batch.refeeds]
+            else:
+                preds = [self.predict(feed) for feed in batch.refeeds]
             try:
                 batch.prediction = np.array(preds)
             except ValueError as err:
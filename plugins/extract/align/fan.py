@@ -94,14 +94,12 @@ class Align(Aligner):
             The center and scale of the bounding box
         """
         logger.trace("Calculating center and scale")  # type:ignore[attr-defined]
-        center_scale = np.empty((len(detected_faces), 68, 3), dtype='float32')
-        for index, face in enumerate(detected_faces):
-            x_ctr = (T.cast(int, face.left) + face.right) / 2.0
-            y_ctr = (T.cast(int, face.top) + face.bottom) / 2.0 - T.cast(int, face.height) * 0.12
-            scale = (T.cast(int, face.width) + T.cast(int, face.height)) * self.reference_scale
-            center_scale[index, :, 0] = np.full(68, x_ctr, dtype='float32')
-            center_scale[index, :, 1] = np.full(68, y_ctr, dtype='float32')
-            center_scale[index, :, 2] = np.full(68, scale, dtype='float32')
+        boxes = np.array([(face.left, face.top, face.width, face.height)
+                          for face in detected_faces], dtype='float32')
+        x_ctr = boxes[:, 0] + boxes[:, 2] / 2.0
+        y_ctr = boxes[:, 1] + boxes[:, 3] / 2.0 - boxes[:, 3] * 0.12
+        scale = (boxes[:, 2] + boxes[:, 3]) * self.reference_scale
+        center_scale = np.repeat(np.stack([x_ctr, y_ctr, scale], axis=1)[:, None, :], 68, axis=1)
         logger.trace("Calculated center and scale: %s", center_scale)  # type:ignore[attr-defined]
         return center_scale
 
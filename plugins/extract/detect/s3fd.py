@@ -9,10 +9,11 @@ from __future__ import annotations
 import logging
 import typing as T
 
-from scipy.special import logsumexp
+import cv2
 import numpy as np
 
 # Ignore linting errors from Tensorflow's thoroughly broken import system
+import tensorflow as tf
 from tensorflow import keras
 from tensorflow.keras import backend as K  # pylint:disable=import-error
 from tensorflow.keras.layers import (  # pylint:disable=import-error
@@ -49,7 +50,13 @@ class Detect(Detector):
                           model_kwargs,
                           self.config["allow_growth"],
                           self._exclude_gpus,
-                          confidence)
+                          confidence,
+                          self.config["fp16"])
+        # Feed a placeholder to trigger graph tracing and cuDNN autotuning up front, rather
+        # than stalling the pipeline on the first real batch
+        placeholder_shape = (self.batchsize, self.input_size, self.input_size, 3)
+        placeholder = np.zeros(placeholder_shape, dtype="float32")
+        self.model.predict(placeholder)
 
     def process_input(self, batch: BatchType) -> None:
         """ Compile the detection image(s) for prediction """
@@ -74,6 +81,10 @@ class Detect(Detector):
 class L2Norm(keras.layers.Layer):
     """ L2 Normalization layer for S3FD.
 
+    The layer is pinned to float32 regardless of any active mixed precision policy. The VGG
+    features it normalizes are large enough that squaring and summing them overflows float16,
+    which would silently zero the normalized features.
+
     Parameters
     ----------
     n_channels: int
@@ -82,6 +93,7 @@ class L2Norm(keras.layers.Layer):
         The scaling for initial weights. Default: `1.0`
     """
     def __init__(self, n_channels: int, scale: float = 1.0, **kwargs) -> None:
+        kwargs["dtype"] = "float32"
         super().__init__(**kwargs)
         self._n_channels = n_channels
         self._scale = scale
@@ -104,8 +116,8 @@ class L2Norm(keras.layers.Layer):
         tensor:
             The output from the L2 Normalization Layer
         """
-        norm = K.sqrt(K.sum(K.pow(inputs, 2), axis=-1, keepdims=True)) + 1e-10
-        var_x = inputs / norm * self.w
+        norm = K.sum(K.square(inputs), axis=-1, keepdims=True) + 1e-10
+        var_x = inputs * tf.math.rsqrt(norm) * self.w
         return var_x
 
     def get_config(self) -> dict:
@@ -134,11 +146,15 @@ class SliceO2K(keras.layers.Layer):
         self._ends = ends
         self._axes = axes
         self._steps = steps
+        self._slices: dict[int, list[tuple[int, ...]]] = {}
         super().__init__(**kwargs)
 
     def _get_slices(self, dimensions: int) -> list[tuple[int, ...]]:
         """ Obtain slices for the given number of dimensions.
 
+        The slices are a pure function of the layer's configuration and the tensor rank, so
+        they are computed once per rank and cached for any re-invocations during graph tracing.
+
         Parameters
         ----------
         dimensions: int
@@ -149,10 +165,14 @@ class SliceO2K(keras.layers.Layer):
         list
             The slices for the given number of dimensions
         """
-        axes = tuple(range(dimensions)) if self._axes is None else self._axes
-        steps = (1,) * len(axes) if self._steps is None else self._steps
-        assert len(axes) == len(steps) == len(self._starts) == len(self._ends)
-        return list(zip(axes, self._starts, self._ends, steps))
+        retval = self._slices.get(dimensions)
+        if retval is None:
+            axes = tuple(range(dimensions)) if self._axes is None else self._axes
+            steps = (1,) * len(axes) if self._steps is None else self._steps
+            assert len(axes) == len(steps) == len(self._starts) == len(self._ends)
+            retval = list(zip(axes, self._starts, self._ends, steps))
+            self._slices[dimensions] = retval
+        return retval
 
     def compute_output_shape(self, input_shape: tuple[int, ...]) -> tuple[int, ...]:
         """Computes the output shape of the layer.
@@ -231,21 +251,54 @@ class S3fd(KSession):
                  model_kwargs: dict,
                  allow_growth: bool,
                  exclude_gpus: list[int] | None,
-                 confidence: float) -> None:
+                 confidence: float,
+                 fp16: bool = False) -> None:
         logger.debug("Initializing: %s: (model_path: '%s', model_kwargs: %s, allow_growth: %s, "
-                     "exclude_gpus: %s, confidence: %s)", self.__class__.__name__, model_path,
-                     model_kwargs, allow_growth, exclude_gpus, confidence)
+                     "exclude_gpus: %s, confidence: %s, fp16: %s)", self.__class__.__name__,
+                     model_path, model_kwargs, allow_growth, exclude_gpus, confidence, fp16)
         super().__init__("S3FD",
                          model_path,
                          model_kwargs=model_kwargs,
                          allow_growth=allow_growth,
                          exclude_gpus=exclude_gpus)
+        if fp16:
+            # Build the model under a mixed precision policy so compute runs at FP16 whilst the
+            # weights load as FP32. Restored straight after so other plugins are unaffected
+            previous_policy = keras.mixed_precision.global_policy()
+            keras.mixed_precision.set_global_policy("mixed_float16")
         self.define_model(self.model_definition)
         self.load_model_weights()
+        if fp16:
+            keras.mixed_precision.set_global_policy(previous_policy)
         self.confidence = confidence
-        self.average_img = np.array([104.0, 117.0, 123.0])
+        self.average_img = np.array([104.0, 117.0, 123.0], dtype="float32")
+        self._priors = self._build_priors()
         logger.debug("Initialized: %s", self.__class__.__name__)
 
+    @staticmethod
+    def _build_priors() -> dict[int, np.ndarray]:
+        """ Pre-compute the prior box grid for each stride head.
+
+        The model input is a fixed 640px square, so the anchor centers and sides for every
+        stride are constant and can be built once at init time rather than re-derived for every
+        batch in :func:`_post_process`.
+
+        Returns
+        -------
+        dict
+            The prior boxes in center-offset form, shaped `(height, width, 4)`, keyed by stride
+        """
+        priors = {}
+        for stride in (4, 8, 16, 32, 64, 128):
+            cells = 640 // stride
+            centers = (np.arange(cells, dtype="float32") * stride) + stride / 2
+            grid = np.empty((cells, cells, 4), dtype="float32")
+            grid[..., 0] = centers[None, :]
+            grid[..., 1] = centers[:, None]
+            grid[..., 2:] = stride * 4
+            priors[stride] = grid
+        return priors
+
     def model_definition(self) -> tuple[list[Tensor], list[Tensor]]:
         """ Keras S3FD Model Definition, adapted from FAN pytorch implementation. """
         input_ = Input(shape=(640, 640, 3))
@@ -391,10 +444,9 @@ class S3fd(KSession):
         Returns
         -------
         class:`numpy.ndarray`
-            The normalized images for feeding to the model
+            The normalized images, as contiguous float32, for feeding to the model
         """
-        batch = batch - self.average_img
-        return batch
+        return np.subtract(batch, self.average_img, dtype="float32")
 
     def finalize_predictions(self, bounding_boxes_scales: list[np.ndarray]) -> np.ndarray:
         """ Process the output from the model to obtain faces
@@ -404,42 +456,62 @@ class S3fd(KSession):
         bounding_boxes_scales: list
             The output predictions from the S3FD model
         """
-        ret = []
-        batch_size = range(bounding_boxes_scales[0].shape[0])
-        for img in batch_size:
-            bboxlist = [scale[img:img+1] for scale in bounding_boxes_scales]
-            boxes = self._post_process(bboxlist)
-            finallist = self._nms(boxes, 0.5)
-            ret.append(finallist)
-        return np.array(ret, dtype="object")
-
-    def _post_process(self, bboxlist: list[np.ndarray]) -> np.ndarray:
+        batch_size = bounding_boxes_scales[0].shape[0]
+        boxes = self._post_process(bounding_boxes_scales, batch_size)
+        return np.array([self._nms(box, 0.5) for box in boxes], dtype="object")
+
+    def _post_process(self, bboxlists: list[np.ndarray], batch_size: int) -> list[np.ndarray]:
         """ Perform post processing on output
-            TODO: do this on the batch.
+
+        Gathers the confident hits for every stride head and every image in the batch in one
+        pass, then decodes them with a single vectorized call rather than dispatching NumPy per
+        image and per detection.
+
+        Parameters
+        ----------
+        bboxlists: list
+            The full batch of output predictions from the S3FD model
+        batch_size: int
+            The number of images in the batch
+
+        Returns
+        -------
+        list
+            The decoded bounding box predictions for each image in the batch
         """
-        retval = []
-        for i in range(len(bboxlist) // 2):
-            bboxlist[i * 2] = self.softmax(bboxlist[i * 2], axis=3)
-        for i in range(len(bboxlist) // 2):
-            ocls, oreg = bboxlist[i * 2], bboxlist[i * 2 + 1]
+        scores = []
+        locations = []
+        priors = []
+        batch_indices = []
+        for i in range(len(bboxlists) // 2):
+            ocls = self.softmax(bboxlists[i * 2], axis=3)[..., 1]
+            oreg = bboxlists[i * 2 + 1]
             stride = 2 ** (i + 2)    # 4,8,16,32,64,128
-            poss = zip(*np.where(ocls[:, :, :, 1] > 0.05))
-            for _, hindex, windex in poss:
-                axc, ayc = stride / 2 + windex * stride, stride / 2 + hindex * stride
-                score = ocls[0, hindex, windex, 1]
-                if score >= self.confidence:
-                    loc = np.ascontiguousarray(oreg[0, hindex, windex, :]).reshape((1, 4))
-                    priors = np.array([[axc / 1.0, ayc / 1.0, stride * 4 / 1.0, stride * 4 / 1.0]])
-                    box = self.decode(loc, priors)
-                    x_1, y_1, x_2, y_2 = box[0] * 1.0
-                    retval.append([x_1, y_1, x_2, y_2, score])
-        return_numpy = np.array(retval) if len(retval) != 0 else np.zeros((1, 5))
-        return return_numpy
+            bindex, hindex, windex = np.where((ocls > 0.05) & (ocls >= self.confidence))
+            if not bindex.size:
+                continue
+            priors.append(self._priors[stride][hindex, windex])
+            locations.append(oreg[bindex, hindex, windex])
+            scores.append(ocls[bindex, hindex, windex])
+            batch_indices.append(bindex)
+
+        if not scores:
+            return [np.empty((0, 5), dtype="float32") for _ in range(batch_size)]
+
+        all_locations = np.concatenate(locations)
+        detections = np.empty((all_locations.shape[0], 5), dtype="float32")
+        detections[:, :4] = self.decode(all_locations, np.concatenate(priors))
+        detections[:, 4] = np.concatenate(scores)
+        batch_index = np.concatenate(batch_indices)
+        order = np.argsort(batch_index, kind="stable")
+        return np.split(detections[order],
+                        np.searchsorted(batch_index[order], range(1, batch_size)))
 
     @staticmethod
     def softmax(inp, axis: int) -> np.ndarray:
         """Compute softmax values for each sets of scores in x."""
-        return np.exp(inp - logsumexp(inp, axis=axis, keepdims=True))
+        exp = np.exp(inp - inp.max(axis=axis, keepdims=True))
+        return exp / exp.sum(axis=axis, keepdims=True)
 
     @staticmethod
     def decode(location: np.ndarray, priors: np.ndarray) -> np.ndarray:
@@ -459,36 +531,47 @@ class S3fd(KSession):
             decoded bounding box predictions
         """
         variances = [0.1, 0.2]
-        boxes = np.concatenate((priors[:, :2] + location[:, :2] * variances[0] * priors[:, 2:],
-                                priors[:, 2:] * np.exp(location[:, 2:] * variances[1])), axis=1)
-        boxes[:, :2] -= boxes[:, 2:] / 2
-        boxes[:, 2:] += boxes[:, :2]
-        return boxes
+        centers = priors[:, :2] + location[:, :2] * variances[0] * priors[:, 2:]
+        half_sides = priors[:, 2:] * np.exp(location[:, 2:] * variances[1]) * 0.5
+        return np.concatenate((centers - half_sides, centers + half_sides), axis=1)
 
     @staticmethod
     def _nms(boxes: np.ndarray, threshold: float) -> np.ndarray:
-        """ Perform Non-Maximum Suppression """
-        retained_box_indices = []
+        """ Perform Non-Maximum Suppression
 
+        Suppression is delegated to OpenCV's SIMD C++ implementation. The weighted box voting
+        that the previous pure NumPy implementation performed is retained by averaging each
+        survivor with the candidates it suppressed.
+        """
+        if boxes.size == 0:
+            return boxes
+        rects = boxes[:, :4].astype("float32")
+        rects[:, 2:] -= rects[:, :2]  # NMSBoxes expects (x, y, width, height)
+        keep = cv2.dnn.NMSBoxes(rects, boxes[:, 4].astype("float32"), 0.0, threshold)
+        if len(keep) == 0:
+            return np.empty((0, 5), dtype=boxes.dtype)
+        keep = np.array(keep).flatten()  # Returned sorted by descending score
+
+        # Vote each retained box with the candidates it suppressed, attributing each suppressed
+        # box to the highest scoring retained box that it overlaps
         areas = (boxes[:, 2] - boxes[:, 0] + 1) * (boxes[:, 3] - boxes[:, 1] + 1)
-        ranked_indices = boxes[:, 4].argsort()[::-1]
-        while ranked_indices.size > 0:
-            best_rest = ranked_indices[0], ranked_indices[1:]
-
-            max_of_xy = np.maximum(boxes[best_rest[0], :2], boxes[best_rest[1], :2])
-            min_of_xy = np.minimum(boxes[best_rest[0], 2:4], boxes[best_rest[1], 2:4])
+        claimed = np.zeros(boxes.shape[0], dtype="bool")
+        claimed[keep] = True
+        retval = boxes[keep]
+        for out_idx, best in enumerate(keep):
+            rest = np.flatnonzero(~claimed)
+            if rest.size == 0:
+                break
+            max_of_xy = np.maximum(boxes[best, :2], boxes[rest, :2])
+            min_of_xy = np.minimum(boxes[best, 2:4], boxes[rest, 2:4])
             width_height = np.maximum(0, min_of_xy - max_of_xy + 1)
             intersection_areas = width_height[:, 0] * width_height[:, 1]
-            iou = intersection_areas / (areas[best_rest[0]] +
-                                        areas[best_rest[1]] - intersection_areas)
-
-            overlapping_boxes = (iou > threshold).nonzero()[0]
-            if len(overlapping_boxes) != 0:
-                overlap_set = ranked_indices[overlapping_boxes + 1]
-                vote = np.average(boxes[overlap_set, :4], axis=0, weights=boxes[overlap_set, 4])
-                boxes[best_rest[0], :4] = vote
-            retained_box_indices.append(best_rest[0])
-
-            non_overlapping_boxes = (iou <= threshold).nonzero()[0]
-            ranked_indices = ranked_indices[non_overlapping_boxes + 1]
-        return boxes[retained_box_indices]
+            iou = intersection_areas / (areas[best] + areas[rest] - intersection_areas)
+            overlap_set = rest[iou > threshold]
+            if overlap_set.size == 0:
+                continue
+            claimed[overlap_set] = True
+            retval[out_idx, :4] = np.average(boxes[overlap_set, :4],
+                                             axis=0,
+                                             weights=boxes[overlap_set, 4])
+        return retval
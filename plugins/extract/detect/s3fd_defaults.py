@@ -64,6 +64,18 @@ _DEFAULTS = {
         gui_radio=False,
         fixed=True,
     ),
+    "fp16": dict(
+        default=False,
+        info="Run the detection model at half precision (FP16). This halves the VRAM required "
+             "by the model and can significantly speed up detection on GPUs which have "
+             "dedicated FP16 hardware (Nvidia Pascal and later). It may very marginally reduce "
+             "detection accuracy and gives no benefit when running on CPU.",
+        datatype=bool,
+        choices=[],
+        group="settings",
+        gui_radio=False,
+        fixed=True,
+    ),
     "batch-size": dict(
         default=4,
         info="The batch size to use. To a point, higher batch sizes equal better performance, "
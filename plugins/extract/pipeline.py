@@ -866,7 +866,7 @@ class ExtractMedia():
         return self._sub_folders
 
     def get_image_copy(self, color_format: T.Literal["BGR", "RGB", "GRAY"]) -> np.ndarray:
-        """ Get a copy of the image in the requested color format.
+        """ Get the image in the requested color format.
 
         Parameters
         ----------
@@ -876,7 +876,9 @@ class ExtractMedia():
         Returns
         -------
         :class:`numpy.ndarray`:
-            A copy of :attr:`image` in the requested :attr:`color_format`
+            :attr:`image` in the requested :attr:`color_format`. This will be a copy of the
+            stored image unless the requested format matches the stored format, in which case
+            the stored image is returned directly and should not be written to
         """
         logger.trace("Requested color format '%s' for frame '%s'",  # type: ignore
                      color_format, self._filename)
@@ -945,13 +947,17 @@ class ExtractMedia():
         self._frame_metadata = metadata
 
     def _image_as_bgr(self) -> np.ndarray:
-        """ Get a copy of the source frame in BGR format.
+        """ Get the source frame in BGR format.
+
+        As the frame is already stored in BGR format, the stored image is returned without
+        copying. A copy is only made if an alpha channel needs to be stripped.
 
         Returns
         -------
         :class:`numpy.ndarray`:
-            A copy of :attr:`image` in BGR color format """
-        return self.image[..., :3].copy()
+            :attr:`image` in BGR color format """
+        image = self.image[..., :3]
+        return image if image.flags["C_CONTIGUOUS"] else np.ascontiguousarray(image)
 
     def _image_as_rgb(self) -> np.ndarray:
         """ Get a copy of the source frame in RGB format.
@@ -960,7 +966,8 @@ class ExtractMedia():
         -------
         :class:`numpy.ndarray`:
             A copy of :attr:`image` in RGB color format """
-        return self.image[..., 2::-1].copy()
+        code = cv2.COLOR_BGRA2RGB if self.image.shape[-1] == 4 else cv2.COLOR_BGR2RGB
+        return cv2.cvtColor(self.image, code)
 
     def _image_as_gray(self) -> np.ndarray:
         """ Get a copy of the source frame in gray-scale format.
@@ -969,4 +976,4 @@ class ExtractMedia():
         -------
         :class:`numpy.ndarray`:
             A copy of :attr:`image` in gray-scale color format """
-        return cv2.cvtColor(self.image.copy(), cv2.COLOR_BGR2GRAY)
+        return cv2.cvtColor(self.image, cv2.COLOR_BGR2GRAY)
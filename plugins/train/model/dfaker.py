@@ -6,10 +6,10 @@ import sys
 
 # Ignore linting errors from Tensorflow's thoroughly broken import system
 from tensorflow.keras.initializers import RandomNormal  # pylint:disable=import-error
-from tensorflow.keras.layers import Input, LeakyReLU  # pylint:disable=import-error
+from tensorflow.keras.layers import Input  # pylint:disable=import-error
 from tensorflow.keras.models import Model as KModel  # pylint:disable=import-error
 
-from lib.model.nn_blocks import Conv2DOutput, UpscaleBlock, ResidualBlock
+from lib.model.nn_blocks import Conv2DOutput, UpscaleBlock, UpscaleResidualBlock
 from .original import Model as OriginalModel
 
 logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
@@ -33,18 +33,10 @@ class Model(OriginalModel):
         var_x = input_
 
         if self._output_size == 256:
-            var_x = UpscaleBlock(1024, activation=None)(var_x)
-            var_x = LeakyReLU(alpha=0.2)(var_x)
-            var_x = ResidualBlock(1024, kernel_initializer=self.kernel_initializer)(var_x)
-        var_x = UpscaleBlock(512, activation=None)(var_x)
-        var_x = LeakyReLU(alpha=0.2)(var_x)
-        var_x = ResidualBlock(512, kernel_initializer=self.kernel_initializer)(var_x)
-        var_x = UpscaleBlock(256, activation=None)(var_x)
-        var_x = LeakyReLU(alpha=0.2)(var_x)
-        var_x = ResidualBlock(256, kernel_initializer=self.kernel_initializer)(var_x)
-        var_x = UpscaleBlock(128, activation=None)(var_x)
-        var_x = LeakyReLU(alpha=0.2)(var_x)
-        var_x = ResidualBlock(128, kernel_initializer=self.kernel_initializer)(var_x)
+            var_x = UpscaleResidualBlock(1024, kernel_initializer=self.kernel_initializer)(var_x)
+        var_x = UpscaleResidualBlock(512, kernel_initializer=self.kernel_initializer)(var_x)
+        var_x = UpscaleResidualBlock(256, kernel_initializer=self.kernel_initializer)(var_x)
+        var_x = UpscaleResidualBlock(128, kernel_initializer=self.kernel_initializer)(var_x)
         var_x = UpscaleBlock(64, activation="leakyrelu")(var_x)
         var_x = Conv2DOutput(3, 5, name=f"face_out_{side}")(var_x)
         outputs = [var_x]
@@ -73,4 +73,5 @@ def test_blocks(use_icnr_init, use_convaware_init, use_reflect_padding):
     block_test(nn_blocks.UpscaleBlock(64), input_shape=(2, 4, 4, 128))
     block_test(nn_blocks.Upscale2xBlock(64, fast=True), input_shape=(2, 4, 4, 128))
     block_test(nn_blocks.Upscale2xBlock(64, fast=False), input_shape=(2, 4, 4, 128))
+    block_test(nn_blocks.UpscaleResidualBlock(64), input_shape=(2, 4, 4, 128))
     block_test(nn_blocks.ResidualBlock(64), input_shape=(2, 4, 4, 64))